@@ -10,7 +10,12 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import OcadoApiClient
-from .const import CONF_REFRESH_TOKEN, CONF_SESSION_TOKEN, DOMAIN
+from .const import (
+    CONF_DELIVERY_DESTINATION_ID,
+    CONF_REFRESH_TOKEN,
+    CONF_SESSION_TOKEN,
+    DOMAIN,
+)
 from .coordinator import OcadoCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,6 +33,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: OcadoConfigEntry) -> boo
         session=session,
         session_token=entry.data[CONF_SESSION_TOKEN],
         refresh_token=entry.data[CONF_REFRESH_TOKEN],
+        delivery_destination_id=entry.data.get(CONF_DELIVERY_DESTINATION_ID),
     )
 
     coordinator = OcadoCoordinator(hass, client, entry)
@@ -2,18 +2,58 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import itertools
 import logging
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
 import aiohttp
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    import json
+
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 from .const import API_BASE, API_KEY, BANNER_ID, UA_API
 
 _LOGGER = logging.getLogger(__name__)
 
+# API endpoints
+_URL_REFRESH = f"{API_BASE}/v1/authorize/refresh"
+_URL_USER = f"{API_BASE}/v1/user/current"
+_URL_ORDERS_RECENT = f"{API_BASE}/v2/orders/recent"
+_URL_ORDERS_ACTIVE = f"{API_BASE}/v3/orders/not-cancelled-count"
+_URL_LOCATIONS = f"{API_BASE}/v2/delivery/locations"
+_URL_NEXT_SLOT = f"{API_BASE}/v4/slot/next-available"
+_URL_CART = f"{API_BASE}/v1/carts/active"
+_URL_SUB = f"{API_BASE}/v1/user/subscriptions/delivery/active"
+
+# aiohttp decodes Brotli transparently when either binding is installed;
+# only advertise it when the response can actually be decoded.
+_ACCEPT_ENCODING = (
+    "gzip, br, deflate"
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi")
+    else "gzip, deflate"
+)
+
+# Order statuses not counted towards the active order count
+_INACTIVE_ORDER_STATUSES = frozenset({"cancelled", "delivered"})
+
+# Shared read-only default for missing nested objects in API payloads
+_EMPTY: dict[str, Any] = {}
 
-@dataclass
+
+@dataclass(slots=True)
 class OcadoTokens:
     """Session tokens."""
 
@@ -21,7 +61,7 @@ class OcadoTokens:
     refresh_token: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OcadoOrder:
     """Parsed order."""
 
@@ -37,9 +77,16 @@ class OcadoOrder:
     delivery_method: str
     slot_cost: str = ""
     is_editable: bool = False
+    display_total: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Formatted once at parse time; frozen, so bypass __setattr__
+        object.__setattr__(
+            self, "display_total", f"{self.currency} {self.total_price}"
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class OcadoCart:
     """Simplified cart data."""
 
@@ -48,7 +95,7 @@ class OcadoCart:
     currency: str = "GBP"
 
 
-@dataclass
+@dataclass(slots=True)
 class OcadoDeliverySlot:
     """Next available delivery slot."""
 
@@ -60,7 +107,7 @@ class OcadoDeliverySlot:
     delivery_method: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class OcadoUserProfile:
     """User profile data."""
 
@@ -70,19 +117,29 @@ class OcadoUserProfile:
     customer_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class OcadoData:
     """Container for all Ocado data returned by the coordinator."""
 
     user: OcadoUserProfile = field(default_factory=OcadoUserProfile)
-    upcoming_orders: list[OcadoOrder] = field(default_factory=list)
-    delivered_orders: list[OcadoOrder] = field(default_factory=list)
+    upcoming_orders: tuple[OcadoOrder, ...] = ()
+    delivered_orders: tuple[OcadoOrder, ...] = ()
     cart: OcadoCart = field(default_factory=OcadoCart)
     next_slot: Optional[OcadoDeliverySlot] = None
     active_order_count: int = 0
     has_delivery_subscription: bool = False
     subscription_type: str = ""
 
+    @property
+    def next_order(self) -> Optional[OcadoOrder]:
+        """Return the first upcoming order, if any."""
+        return self.upcoming_orders[0] if self.upcoming_orders else None
+
+    @property
+    def last_delivered_order(self) -> Optional[OcadoOrder]:
+        """Return the most recently delivered order, if any."""
+        return self.delivered_orders[0] if self.delivered_orders else None
+
 
 class OcadoApiError(Exception):
     """Base exception for Ocado API errors."""
@@ -92,6 +149,18 @@ class OcadoAuthError(OcadoApiError):
     """Authentication error (invalid/expired tokens)."""
 
 
+# Expected transient failures; logged without a traceback
+_EXPECTED_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, OcadoApiError)
+
+
+def _log_fetch_error(level: int, msg: str, err: BaseException) -> None:
+    """Log a failed fetch, with a traceback only for unexpected errors."""
+    if isinstance(err, _EXPECTED_ERRORS):
+        _LOGGER.log(level, "%s: %s: %s", msg, type(err).__name__, err)
+    else:
+        _LOGGER.log(level, msg, exc_info=err)
+
+
 class OcadoApiClient:
     """Async Ocado API client for Home Assistant."""
 
@@ -100,48 +169,77 @@ class OcadoApiClient:
         session: aiohttp.ClientSession,
         session_token: str,
         refresh_token: str,
+        delivery_destination_id: Optional[str] = None,
     ) -> None:
         """Initialise the client."""
         self._session = session
         self._tokens = OcadoTokens(token=session_token, refresh_token=refresh_token)
-        self._delivery_destination_id: Optional[str] = None
-        self._seq_num = 0
-
-    @property
-    def tokens(self) -> OcadoTokens:
-        """Return current tokens."""
-        return self._tokens
-
-    def _next_seq(self) -> str:
-        self._seq_num += 1
-        return str(self._seq_num)
-
-    def _headers(self, extra: dict | None = None) -> dict[str, str]:
-        """Build standard API headers."""
-        h = {
+        self._delivery_destination_id = delivery_destination_id
+        self._refresh_lock = asyncio.Lock()
+        self._seq = itertools.count(1)
+        # Last body hash and decoded payload per cacheable endpoint
+        self._resp_hash: dict[str, int] = {}
+        self._resp_cache: dict[str, Any] = {}
+        # The profile rarely changes; revalidate it instead of re-fetching
+        self._user_etag: Optional[str] = None
+        self._user_cache: Optional[OcadoUserProfile] = None
+        self._auth_header = f"token:{session_token}"
+        self._refresh_body = _json_dumps({"refreshToken": refresh_token})
+        # Headers that never change between requests
+        self._base_headers: dict[str, str] = {
             "Accept": "application/json",
             "Accept-Language": "en-GB",
             "Accept-Currency": "GBP",
-            "Accept-Encoding": "gzip",
+            "Accept-Encoding": _ACCEPT_ENCODING,
             "User-Agent": UA_API,
             "x-api-key": API_KEY,
             "BannerId": BANNER_ID,
             "Ecom-Request-Source": "ios",
             "Ecom-Request-Source-Version": "1.417.2 (33861072)",
             "Client-Features": "image-http-redirects",
-            "sessionsequenceno": self._next_seq(),
-            "Connection": "keep-alive",
         }
-        if self._tokens:
-            h["Authorization"] = f"token:{self._tokens.token}"
+
+    @property
+    def tokens(self) -> OcadoTokens:
+        """Return current tokens."""
+        return self._tokens
+
+    @property
+    def delivery_destination_id(self) -> Optional[str]:
+        """Return the resolved delivery destination ID, if known."""
+        return self._delivery_destination_id
+
+    def _headers(self, extra: dict | None = None) -> dict[str, str]:
+        """Build standard API headers."""
+        h = self._base_headers.copy()
+        h["sessionsequenceno"] = str(next(self._seq))
+        h["Authorization"] = self._auth_header
         if extra:
             h.update(extra)
         return h
 
     # ── Auth ──────────────────────────────────────────────────────────────
 
-    async def async_refresh_token(self) -> OcadoTokens:
-        """Refresh the session token using the refresh token."""
+    async def async_refresh_token(
+        self, stale_token: Optional[str] = None
+    ) -> OcadoTokens:
+        """Refresh the session token using the refresh token.
+
+        Refreshes are serialised. If the session token has already moved on
+        from ``stale_token`` (by default the token current at call time) once
+        the lock is held, the rotated tokens are returned without another
+        refresh request.
+        """
+        if stale_token is None:
+            stale_token = self._tokens.token
+        async with self._refresh_lock:
+            if self._tokens.token != stale_token:
+                _LOGGER.debug("Ocado session token already refreshed")
+                return self._tokens
+            return await self._async_refresh_token_locked()
+
+    async def _async_refresh_token_locked(self) -> OcadoTokens:
+        """POST the refresh token; the caller holds the refresh lock."""
         if not self._tokens or not self._tokens.refresh_token:
             raise OcadoAuthError("No refresh token available")
 
@@ -150,9 +248,9 @@ class OcadoApiClient:
         headers["Authorization"] = f"token:{self._tokens.refresh_token}"
 
         async with self._session.post(
-            f"{API_BASE}/v1/authorize/refresh",
+            _URL_REFRESH,
             headers=headers,
-            json={"refreshToken": self._tokens.refresh_token},
+            data=self._refresh_body,
         ) as resp:
             if resp.status in (400, 401, 403):
                 raise OcadoAuthError(
@@ -160,35 +258,84 @@ class OcadoApiClient:
                     "must be obtained from the Ocado app."
                 )
             resp.raise_for_status()
-            data = await resp.json()
+            data = await resp.json(loads=_json_loads)
 
         self._tokens = OcadoTokens(
             token=data["token"],
             refresh_token=data["refreshToken"],
         )
+        self._auth_header = f"token:{self._tokens.token}"
+        self._refresh_body = _json_dumps(
+            {"refreshToken": self._tokens.refresh_token}
+        )
         _LOGGER.debug("Ocado session token refreshed successfully")
         return self._tokens
 
-    async def _request(
-        self, method: str, url: str, **kwargs: Any
-    ) -> dict | list:
+    async def _request(self, method: str, url: str, **kwargs: Any) -> Any:
         """Make an API request with auto-retry on 401."""
+        data, _ = await self._request_conditional(method, url, **kwargs)
+        return data
+
+    async def _request_conditional(
+        self,
+        method: str,
+        url: str,
+        etag: str | None = None,
+        raw: bool = False,
+        cache_key: str | None = None,
+        **kwargs: Any,
+    ) -> tuple[Any, str | None]:
+        """Make an API request, optionally conditional on an ETag.
+
+        Returns the body and the response ETag. The body is decoded JSON,
+        or the undecoded bytes when ``raw`` is set, and None when the server
+        answers 304 Not Modified.
+
+        With a ``cache_key``, a body identical to the previous one for that
+        key is not decoded again; the previously decoded object is returned.
+        """
+        if cache_key is None or raw:
+            return await self._send(method, url, etag, raw, **kwargs)
+
+        body, etag = await self._send(method, url, etag, True, **kwargs)
+        if body is None:
+            return None, etag
+        digest = hash(body)
+        if self._resp_hash.get(cache_key) == digest:
+            return self._resp_cache[cache_key], etag
+        data = _json_loads(body)
+        self._resp_hash[cache_key] = digest
+        self._resp_cache[cache_key] = data
+        return data, etag
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        etag: str | None,
+        raw: bool,
+        **kwargs: Any,
+    ) -> tuple[Any, str | None]:
+        """Send a request, refreshing the token and retrying once on 401."""
+        extra = {"If-None-Match": etag} if etag else None
         if "headers" not in kwargs:
-            kwargs["headers"] = self._headers()
+            kwargs["headers"] = self._headers(extra)
+        sent_token = self._tokens.token
 
         async with self._session.request(method, url, **kwargs) as resp:
             if resp.status == 401 and self._tokens.refresh_token:
                 _LOGGER.debug("Got 401, attempting token refresh")
                 try:
-                    await self.async_refresh_token()
-                    kwargs["headers"] = self._headers()
+                    # Concurrent requests can all hit a 401 at once; only the
+                    # first refreshes, the rest reuse the rotated token.
+                    await self.async_refresh_token(sent_token)
+                    kwargs["headers"] = self._headers(extra)
                     async with self._session.request(
                         method, url, **kwargs
                     ) as retry_resp:
                         if retry_resp.status == 401:
                             raise OcadoAuthError("Token refresh did not resolve 401")
-                        retry_resp.raise_for_status()
-                        return await retry_resp.json()
+                        return await self._read_response(retry_resp, raw)
                 except OcadoAuthError:
                     raise
                 except Exception as err:
@@ -196,14 +343,23 @@ class OcadoApiClient:
 
             if resp.status == 401:
                 raise OcadoAuthError("Unauthorized and no refresh token available")
-            resp.raise_for_status()
-            return await resp.json()
+            return await self._read_response(resp, raw)
 
-    # ── Validate credentials ──────────────────────────────────────────────
+    @staticmethod
+    async def _read_response(
+        resp: aiohttp.ClientResponse, raw: bool = False
+    ) -> tuple[Any, str | None]:
+        """Decode a response body, treating 304 as an empty body."""
+        etag = resp.headers.get("ETag")
+        if resp.status == 304:
+            return None, etag
+        resp.raise_for_status()
+        if raw:
+            return await resp.read(), etag
+        return await resp.json(loads=_json_loads), etag
 
-    async def async_validate_tokens(self) -> OcadoUserProfile:
-        """Validate tokens by fetching the user profile. Raises on failure."""
-        data = await self._request("GET", f"{API_BASE}/v1/user/current")
+    @staticmethod
+    def _parse_user(data: dict) -> OcadoUserProfile:
         return OcadoUserProfile(
             first_name=data.get("firstName", ""),
             full_name=data.get("fullName", ""),
@@ -211,47 +367,82 @@ class OcadoApiClient:
             customer_id=data.get("retailerCustomerId", ""),
         )
 
+    # ── Validate credentials ──────────────────────────────────────────────
+
+    async def async_validate_tokens(self) -> OcadoUserProfile:
+        """Validate tokens by fetching the user profile. Raises on failure."""
+        data = await self._request("GET", _URL_USER)
+        return self._parse_user(data)
+
     # ── User ──────────────────────────────────────────────────────────────
 
     async def async_get_user(self) -> OcadoUserProfile:
-        """GET /v1/user/current."""
-        data = await self._request("GET", f"{API_BASE}/v1/user/current")
-        return OcadoUserProfile(
-            first_name=data.get("firstName", ""),
-            full_name=data.get("fullName", ""),
-            username=data.get("username", ""),
-            customer_id=data.get("retailerCustomerId", ""),
+        """GET /v1/user/current, revalidated with the cached ETag."""
+        previous = self._resp_cache.get("user")
+        data, etag = await self._request_conditional(
+            "GET", _URL_USER, etag=self._user_etag, cache_key="user"
         )
+        # 304 Not Modified, or a body identical to the last one
+        if self._user_cache is not None and (data is None or data is previous):
+            return self._user_cache
+        user = self._parse_user(data or {})
+        self._user_etag = etag
+        self._user_cache = user
+        return user
 
     # ── Orders ────────────────────────────────────────────────────────────
 
-    async def async_get_recent_orders(self) -> dict[str, list[OcadoOrder]]:
+    async def async_get_recent_orders(
+        self,
+    ) -> dict[str, tuple[OcadoOrder, ...]]:
         """GET /v2/orders/recent → parsed upcoming + delivered."""
-        data = await self._request("GET", f"{API_BASE}/v2/orders/recent")
+        data = await self._request("GET", _URL_ORDERS_RECENT)
+        # Missing or null order lists fall back to an empty tuple
+        parse = self._parse_order
         return {
-            "upcoming": [self._parse_order(o) for o in data.get("upcoming", [])],
-            "delivered": [self._parse_order(o) for o in data.get("delivered", [])],
+            "upcoming": tuple(parse(o) for o in data.get("upcoming") or ()),
+            "delivered": tuple(parse(o) for o in data.get("delivered") or ()),
         }
 
     async def async_get_active_order_count(self) -> int:
         """GET /v3/orders/not-cancelled-count."""
-        data = await self._request(
-            "GET", f"{API_BASE}/v3/orders/not-cancelled-count"
-        )
+        body = await self._request("GET", _URL_ORDERS_ACTIVE, raw=True)
+        return self._parse_count(body or b"")
+
+    @staticmethod
+    def _parse_count(body: bytes) -> int:
+        """Parse the order count body without a full JSON decode."""
         # The response is typically {"count": N} or just an int
+        body = body.strip()
+        if not body or body == b"null":
+            return 0
+        try:
+            if not body.startswith(b"{"):
+                return int(body)
+            key, _, value = body[1:].partition(b":")
+            if key.strip() in (b'"count"', b'"orderCount"'):
+                return int(value.rstrip(b"}"))
+        except ValueError:
+            pass
+        # Anything more elaborate (e.g. "3" or 3.0) goes through the JSON decoder
+        data = _json_loads(body)
         if isinstance(data, dict):
             return data.get("count", data.get("orderCount", 0))
         return int(data) if data else 0
 
     @staticmethod
     def _parse_order(o: dict) -> OcadoOrder:
-        delivery = o.get("delivery", {})
-        slot = delivery.get("slot", {})
-        addr = delivery.get("address", {})
-        price = o.get("totalPrice", {})
-        slot_cost = slot.get("cost", {})
+        get = o.get
+        delivery = get("delivery", _EMPTY)
+        delivery_get = delivery.get
+        slot = delivery_get("slot", _EMPTY)
+        slot_get = slot.get
+        addr = delivery_get("address", _EMPTY)
+        price = get("totalPrice", _EMPTY)
+        price_get = price.get
+        slot_cost = slot_get("cost", _EMPTY)
         # items may be an int count, a list of items, or absent
-        raw_items = o.get("items", 0)
+        raw_items = get("items", 0)
         if isinstance(raw_items, list):
             items_count = len(raw_items)
         elif isinstance(raw_items, int):
@@ -259,18 +450,18 @@ class OcadoApiClient:
         else:
             items_count = 0
         return OcadoOrder(
-            id=o.get("id", ""),
-            status=o.get("status", ""),
-            status_message=o.get("statusMessage", ""),
+            id=get("id", ""),
+            status=get("status", ""),
+            status_message=get("statusMessage", ""),
             items_count=items_count,
-            total_price=price.get("amount", "0"),
-            currency=price.get("currency", "GBP"),
+            total_price=price_get("amount", "0"),
+            currency=price_get("currency", "GBP"),
             delivery_address=addr.get("address", ""),
-            delivery_slot_start=slot.get("startDate", slot.get("start", "")),
-            delivery_slot_end=slot.get("endDate", slot.get("end", "")),
-            delivery_method=delivery.get("deliveryMethod", ""),
+            delivery_slot_start=slot_get("startDate", slot_get("start", "")),
+            delivery_slot_end=slot_get("endDate", slot_get("end", "")),
+            delivery_method=delivery_get("deliveryMethod", ""),
             slot_cost=slot_cost.get("amount", ""),
-            is_editable=o.get("isEditable", False),
+            is_editable=get("isEditable", False),
         )
 
     # ── Delivery Slots ────────────────────────────────────────────────────
@@ -279,7 +470,7 @@ class OcadoApiClient:
         """POST /v2/delivery/locations → delivery destination IDs."""
         data = await self._request(
             "POST",
-            f"{API_BASE}/v2/delivery/locations",
+            _URL_LOCATIONS,
             headers=self._headers({"Content-Type": "application/json"}),
             json={"deliveryMethod": "HOME_DELIVERY"},
         )
@@ -287,25 +478,22 @@ class OcadoApiClient:
             data = [data] if data else []
 
         for loc in data:
-            addr = loc.get("address", {})
+            addr = loc.get("address", _EMPTY)
             if addr.get("primary", False):
                 self._delivery_destination_id = addr.get("deliveryDestinationId")
                 break
         if not self._delivery_destination_id and data:
             self._delivery_destination_id = (
-                data[0].get("address", {}).get("deliveryDestinationId")
+                data[0].get("address", _EMPTY).get("deliveryDestinationId")
             )
         return data
 
     async def async_get_next_slot(self) -> Optional[OcadoDeliverySlot]:
-        """GET /v4/slot/next-available."""
-        if not self._delivery_destination_id:
-            try:
-                await self.async_get_delivery_destinations()
-            except Exception:
-                _LOGGER.warning(
-                    "Failed to fetch delivery destinations", exc_info=True
-                )
+        """GET /v4/slot/next-available.
+
+        Needs a delivery destination ID; async_get_all_data resolves one
+        before calling this.
+        """
         if not self._delivery_destination_id:
             _LOGGER.warning(
                 "No delivery destination ID available — cannot fetch next slot"
@@ -315,17 +503,19 @@ class OcadoApiClient:
         try:
             data = await self._request(
                 "GET",
-                f"{API_BASE}/v4/slot/next-available",
+                _URL_NEXT_SLOT,
                 params={"deliveryDestinationId": self._delivery_destination_id},
             )
-        except Exception:
-            _LOGGER.warning("Could not fetch next available slot", exc_info=True)
+        except Exception as err:
+            _log_fetch_error(
+                logging.WARNING, "Could not fetch next available slot", err
+            )
             return None
 
-        slot = data.get("slot", {})
-        delivery = data.get("delivery", {})
-        window = slot.get("slotWindow", {})
-        addr = delivery.get("address", {})
+        slot = data.get("slot", _EMPTY)
+        delivery = data.get("delivery", _EMPTY)
+        window = slot.get("slotWindow", _EMPTY)
+        addr = delivery.get("address", _EMPTY)
 
         return OcadoDeliverySlot(
             slot_id=slot.get("slotId", ""),
@@ -341,9 +531,9 @@ class OcadoApiClient:
     async def async_get_cart(self) -> OcadoCart:
         """GET /v1/carts/active → simplified cart."""
         try:
-            data = await self._request("GET", f"{API_BASE}/v1/carts/active")
-        except Exception:
-            _LOGGER.debug("Could not fetch cart", exc_info=True)
+            data = await self._request("GET", _URL_CART)
+        except Exception as err:
+            _log_fetch_error(logging.DEBUG, "Could not fetch cart", err)
             return OcadoCart()
 
         # Cart structure varies; handle gracefully
@@ -364,7 +554,7 @@ class OcadoApiClient:
 
             # Try totals.itemPriceAfterPromos (v1/carts/active), then
             # totalPrice / total as fallback
-            totals = data.get("totals", {})
+            totals = data.get("totals", _EMPTY)
             price_obj = (
                 totals.get("itemPriceAfterPromos")
                 if isinstance(totals, dict)
@@ -374,7 +564,7 @@ class OcadoApiClient:
                 price = price_obj.get("amount", "0.00")
                 currency = price_obj.get("currency", "GBP")
             else:
-                total = data.get("totalPrice", data.get("total", {}))
+                total = data.get("totalPrice", data.get("total", _EMPTY))
                 if isinstance(total, dict):
                     price = total.get("amount", "0.00")
                     currency = total.get("currency", "GBP")
@@ -396,11 +586,14 @@ class OcadoApiClient:
         try:
             data = await self._request(
                 "GET",
-                f"{API_BASE}/v1/user/subscriptions/delivery/active",
+                _URL_SUB,
+                cache_key="subscription",
             )
             return data if isinstance(data, dict) else {}
-        except Exception:
-            _LOGGER.debug("Could not fetch delivery subscription", exc_info=True)
+        except Exception as err:
+            _log_fetch_error(
+                logging.DEBUG, "Could not fetch delivery subscription", err
+            )
             return {}
 
     # ── Full data fetch (used by coordinator) ─────────────────────────────
@@ -413,61 +606,94 @@ class OcadoApiClient:
         """
         result = OcadoData()
 
+        # The next-slot lookup needs a delivery destination; resolve it up
+        # front so the requests below are fully independent.
+        if not self._delivery_destination_id:
+            try:
+                await self.async_get_delivery_destinations()
+            except OcadoAuthError:
+                raise
+            except Exception as err:
+                _log_fetch_error(
+                    logging.WARNING, "Failed to fetch delivery destinations", err
+                )
+
+        user, orders, cart, next_slot, sub = await asyncio.gather(
+            self.async_get_user(),
+            self.async_get_recent_orders(),
+            self.async_get_cart(),
+            self.async_get_next_slot(),
+            self.async_get_delivery_subscription(),
+            return_exceptions=True,
+        )
+
+        for res in (user, orders, cart, next_slot, sub):
+            if isinstance(res, OcadoAuthError):
+                raise res
+
         # User
-        try:
-            result.user = await self.async_get_user()
-        except OcadoAuthError:
-            raise
-        except Exception:
-            _LOGGER.warning("Failed to fetch Ocado user profile", exc_info=True)
+        if isinstance(user, Exception):
+            _log_fetch_error(
+                logging.WARNING, "Failed to fetch Ocado user profile", user
+            )
+        else:
+            result.user = user
 
         # Orders
-        try:
-            orders = await self.async_get_recent_orders()
-            result.upcoming_orders = orders.get("upcoming", [])
-            result.delivered_orders = orders.get("delivered", [])
+        if isinstance(orders, Exception):
+            _log_fetch_error(
+                logging.WARNING, "Failed to fetch Ocado orders", orders
+            )
+        else:
+            result.upcoming_orders = orders["upcoming"]
             # Sort delivered orders by slot start descending so [0] is most recent
-            result.delivered_orders.sort(
-                key=lambda o: o.delivery_slot_start, reverse=True
+            result.delivered_orders = tuple(
+                sorted(
+                    orders["delivered"],
+                    key=lambda o: o.delivery_slot_start or "",
+                    reverse=True,
+                )
             )
-        except OcadoAuthError:
-            raise
-        except Exception:
-            _LOGGER.warning("Failed to fetch Ocado orders", exc_info=True)
 
-        # Active order count
-        try:
-            result.active_order_count = await self.async_get_active_order_count()
-        except OcadoAuthError:
-            raise
-        except Exception:
-            _LOGGER.debug("Failed to fetch active order count", exc_info=True)
+        # Active order count — derived from the upcoming orders when we have
+        # them, otherwise ask the server.
+        if isinstance(orders, Exception):
+            try:
+                result.active_order_count = (
+                    await self.async_get_active_order_count()
+                )
+            except OcadoAuthError:
+                raise
+            except Exception as err:
+                _log_fetch_error(
+                    logging.DEBUG, "Failed to fetch active order count", err
+                )
+        else:
+            result.active_order_count = sum(
+                1
+                for o in result.upcoming_orders
+                if (o.status or "").lower() not in _INACTIVE_ORDER_STATUSES
+            )
 
         # Cart
-        try:
-            result.cart = await self.async_get_cart()
-        except OcadoAuthError:
-            raise
-        except Exception:
-            _LOGGER.debug("Failed to fetch Ocado cart", exc_info=True)
+        if isinstance(cart, Exception):
+            _log_fetch_error(logging.DEBUG, "Failed to fetch Ocado cart", cart)
+        else:
+            result.cart = cart
 
         # Next slot
-        try:
-            result.next_slot = await self.async_get_next_slot()
-        except OcadoAuthError:
-            raise
-        except Exception:
-            _LOGGER.debug("Failed to fetch next delivery slot", exc_info=True)
+        if isinstance(next_slot, Exception):
+            _log_fetch_error(
+                logging.DEBUG, "Failed to fetch next delivery slot", next_slot
+            )
+        else:
+            result.next_slot = next_slot
 
         # Subscription
-        try:
-            sub = await self.async_get_delivery_subscription()
-            if sub:
-                result.has_delivery_subscription = True
-                result.subscription_type = sub.get("type", sub.get("name", "Active"))
-        except OcadoAuthError:
-            raise
-        except Exception:
-            _LOGGER.debug("Failed to fetch subscription", exc_info=True)
+        if isinstance(sub, Exception):
+            _log_fetch_error(logging.DEBUG, "Failed to fetch subscription", sub)
+        elif sub:
+            result.has_delivery_subscription = True
+            result.subscription_type = sub.get("type", sub.get("name", "Active"))
 
         return result
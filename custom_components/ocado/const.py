@@ -5,6 +5,7 @@ MANUFACTURER = "Ocado"
 
 CONF_SESSION_TOKEN = "session_token"
 CONF_REFRESH_TOKEN = "refresh_token"
+CONF_DELIVERY_DESTINATION_ID = "delivery_destination_id"
 
 # API constants (extracted from Ocado iOS app traffic)
 API_BASE = "https://api.mol.osp.tech/rocket-osp"
@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import OcadoApiClient, OcadoAuthError, OcadoData
 from .const import (
+    CONF_DELIVERY_DESTINATION_ID,
     CONF_REFRESH_TOKEN,
     CONF_SESSION_TOKEN,
     DEFAULT_SCAN_INTERVAL,
@@ -27,8 +29,9 @@ class OcadoCoordinator(DataUpdateCoordinator[OcadoData]):
 
     Handles:
     - Periodic data polling (every 10 minutes)
-    - Periodic token refresh (every 1 hour)
-    - Persisting refreshed tokens back to config entry
+    - Periodic token refresh (every 1 hour, on a separate timer)
+    - Persisting refreshed tokens and the delivery destination back to
+      the config entry
     - Triggering re-auth flow on permanent auth failure
     """
 
@@ -49,39 +52,49 @@ class OcadoCoordinator(DataUpdateCoordinator[OcadoData]):
         )
         self.client = client
         self.config_entry = entry
-        self._refresh_counter = 0
-        # How many data polls between token refreshes
-        self._refresh_every_n = max(
-            1, TOKEN_REFRESH_INTERVAL // DEFAULT_SCAN_INTERVAL
+        # Token refresh runs on its own timer so it never delays a data poll
+        self._unsub_token_refresh = async_track_time_interval(
+            hass,
+            self._async_scheduled_token_refresh,
+            timedelta(seconds=TOKEN_REFRESH_INTERVAL),
         )
 
-    async def _async_update_data(self) -> OcadoData:
-        """Fetch data from Ocado API.
+    async def async_shutdown(self) -> None:
+        """Cancel the token refresh timer and shut down the coordinator."""
+        if self._unsub_token_refresh is not None:
+            self._unsub_token_refresh()
+            self._unsub_token_refresh = None
+        await super().async_shutdown()
+
+    async def _async_scheduled_token_refresh(self, _now: datetime) -> None:
+        """Periodically refresh the session token.
 
-        Also periodically refreshes the session token.
+        Never triggers re-auth directly. If the token is truly dead the
+        data-fetch path will catch it.
         """
-        # Periodic token refresh — never triggers re-auth directly.
-        # If the token is truly dead the data-fetch path will catch it.
-        self._refresh_counter += 1
-        if self._refresh_counter >= self._refresh_every_n:
-            try:
-                await self._async_refresh_and_persist()
-                self._refresh_counter = 0
-            except OcadoAuthError:
-                # Might be transient; let the data fetch decide.
-                self._refresh_counter = 0
-                _LOGGER.warning(
-                    "Periodic token refresh returned auth error; "
-                    "data fetch will determine if re-auth is needed"
-                )
-            except Exception:
-                # Network / transient error — retry on the next poll.
-                self._refresh_counter = self._refresh_every_n - 1
-                _LOGGER.debug(
-                    "Periodic token refresh failed (transient); "
-                    "will retry next poll"
-                )
+        try:
+            await self._async_refresh_and_persist()
+        except OcadoAuthError:
+            # Might be transient; let the data fetch decide.
+            _LOGGER.warning(
+                "Periodic token refresh returned auth error; "
+                "data fetch will determine if re-auth is needed"
+            )
+        except Exception:
+            # Network / transient error — retry on the next interval.
+            _LOGGER.debug(
+                "Periodic token refresh failed (transient); "
+                "will retry next interval"
+            )
 
+    async def _async_update_data(self) -> OcadoData:
+        """Fetch data from Ocado API."""
+        data = await self._async_fetch_data()
+        self._async_persist_delivery_destination()
+        return data
+
+    async def _async_fetch_data(self) -> OcadoData:
+        """Fetch data, refreshing the token once on auth failure."""
         try:
             return await self.client.async_get_all_data()
         except OcadoAuthError as err:
@@ -125,8 +138,25 @@ class OcadoCoordinator(DataUpdateCoordinator[OcadoData]):
         self.hass.config_entries.async_update_entry(
             self.config_entry,
             data={
+                **self.config_entry.data,
                 CONF_SESSION_TOKEN: new_tokens.token,
                 CONF_REFRESH_TOKEN: new_tokens.refresh_token,
             },
         )
         _LOGGER.debug("Ocado tokens refreshed and persisted")
+
+    def _async_persist_delivery_destination(self) -> None:
+        """Persist a newly discovered delivery destination ID.
+
+        Saves the delivery locations lookup on the first poll after a restart.
+        """
+        dest_id = self.client.delivery_destination_id
+        if not dest_id or dest_id == self.config_entry.data.get(
+            CONF_DELIVERY_DESTINATION_ID
+        ):
+            return
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            data={**self.config_entry.data, CONF_DELIVERY_DESTINATION_ID: dest_id},
+        )
+        _LOGGER.debug("Ocado delivery destination persisted")
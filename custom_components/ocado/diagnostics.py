@@ -8,10 +8,20 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.core import HomeAssistant
 
 from . import OcadoConfigEntry
-from .const import CONF_REFRESH_TOKEN, CONF_SESSION_TOKEN
+from .const import (
+    CONF_DELIVERY_DESTINATION_ID,
+    CONF_REFRESH_TOKEN,
+    CONF_SESSION_TOKEN,
+)
 
-TO_REDACT_CONFIG = {CONF_SESSION_TOKEN, CONF_REFRESH_TOKEN}
-TO_REDACT_DATA = {"username", "account_email", "customer_id", "address", "delivery_address"}
+TO_REDACT_CONFIG: frozenset[str] = frozenset(
+    {CONF_SESSION_TOKEN, CONF_REFRESH_TOKEN, CONF_DELIVERY_DESTINATION_ID}
+)
+TO_REDACT_DATA: frozenset[str] = frozenset(
+    {"username", "account_email", "customer_id", "address", "delivery_address"}
+)
+
+_REDACTED = "**REDACTED**"
 
 
 async def async_get_config_entry_diagnostics(
@@ -22,7 +32,7 @@ async def async_get_config_entry_diagnostics(
     data = coordinator.data
 
     diag: dict[str, Any] = {
-        "config_entry": async_redact_data(dict(entry.data), TO_REDACT_CONFIG),
+        "config_entry": async_redact_data(entry.data, TO_REDACT_CONFIG),
         "coordinator": {
             "last_update_success": coordinator.last_update_success,
             "update_interval": str(coordinator.update_interval),
@@ -30,15 +40,18 @@ async def async_get_config_entry_diagnostics(
     }
 
     if data:
+        upcoming = data.upcoming_orders
+        delivered = data.delivered_orders
+        redacted = _REDACTED
         diag["data"] = {
             "user": {
                 "first_name": data.user.first_name,
                 "full_name": data.user.full_name,
-                "username": "**REDACTED**",
-                "customer_id": "**REDACTED**",
+                "username": redacted,
+                "customer_id": redacted,
             },
-            "upcoming_orders_count": len(data.upcoming_orders),
-            "delivered_orders_count": len(data.delivered_orders),
+            "upcoming_orders_count": len(upcoming),
+            "delivered_orders_count": len(delivered),
             "upcoming_orders": [
                 {
                     "id": o.id,
@@ -47,13 +60,13 @@ async def async_get_config_entry_diagnostics(
                     "items_count": o.items_count,
                     "total_price": o.total_price,
                     "currency": o.currency,
-                    "delivery_address": "**REDACTED**",
+                    "delivery_address": redacted,
                     "delivery_slot_start": o.delivery_slot_start,
                     "delivery_slot_end": o.delivery_slot_end,
                     "delivery_method": o.delivery_method,
                     "is_editable": o.is_editable,
                 }
-                for o in data.upcoming_orders
+                for o in upcoming
             ],
             "cart": {
                 "item_count": data.cart.item_count,
@@ -67,7 +80,7 @@ async def async_get_config_entry_diagnostics(
                     "start_time": data.next_slot.start_time,
                     "end_time": data.next_slot.end_time,
                     "delivery_method": data.next_slot.delivery_method,
-                    "address": "**REDACTED**",
+                    "address": redacted,
                 }
                 if data.next_slot
                 else None
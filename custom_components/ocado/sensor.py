@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
@@ -15,7 +16,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -27,8 +28,14 @@ from .coordinator import OcadoCoordinator
 
 def _parse_iso_date(dt_str: str) -> datetime | None:
     """Parse an ISO datetime string, returning None on failure."""
-    if not dt_str:
+    if not dt_str or not isinstance(dt_str, str):
         return None
+    return _parse_iso_date_cached(dt_str)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_iso_date_cached(dt_str: str) -> datetime | None:
+    """Parse a non-empty ISO datetime string; results are memoized."""
     try:
         # Strip Java ZonedDateTime bracket suffix e.g. [Europe/London]
         clean = dt_str.split("[")[0].replace("Z", "+00:00")
@@ -45,6 +52,69 @@ class OcadoSensorEntityDescription(SensorEntityDescription):
     attributes_fn: Callable[[OcadoData], dict[str, Any]] | None = None
 
 
+# ── Attribute helpers ─────────────────────────────────────────────────────
+
+
+def _next_delivery_date_attrs(d: OcadoData) -> dict[str, Any]:
+    if (o := d.next_order) is None:
+        return {}
+    return {
+        "order_id": o.id,
+        "delivery_method": o.delivery_method,
+        "address": o.delivery_address,
+    }
+
+
+def _next_delivery_slot_end_attrs(d: OcadoData) -> dict[str, Any]:
+    if (o := d.next_order) is None:
+        return {}
+    return {
+        "slot_start": o.delivery_slot_start,
+        "slot_end": o.delivery_slot_end,
+        "delivery_method": o.delivery_method,
+    }
+
+
+def _next_delivery_total_attrs(d: OcadoData) -> dict[str, Any]:
+    if (o := d.next_order) is None:
+        return {}
+    return {
+        "slot_cost": float(o.slot_cost) if o.slot_cost else None,
+        "currency": o.currency,
+    }
+
+
+def _next_delivery_status_attrs(d: OcadoData) -> dict[str, Any]:
+    if (o := d.next_order) is None:
+        return {}
+    return {
+        "status_code": o.status,
+        "is_editable": o.is_editable,
+    }
+
+
+def _next_available_slot_attrs(d: OcadoData) -> dict[str, Any]:
+    if not (slot := d.next_slot):
+        return {}
+    return {
+        "end_time": _parse_iso_date(slot.end_time),
+        "slot_type": slot.slot_type,
+        "delivery_method": slot.delivery_method,
+        "address": slot.address,
+    }
+
+
+def _last_delivery_date_attrs(d: OcadoData) -> dict[str, Any]:
+    if (o := d.last_delivered_order) is None:
+        return {}
+    return {
+        "order_id": o.id,
+        "items": o.items_count,
+        "total": float(o.total_price) if o.total_price else 0.0,
+        "currency": o.currency,
+    }
+
+
 # ── Sensor definitions ────────────────────────────────────────────────────
 
 SENSOR_DESCRIPTIONS: tuple[OcadoSensorEntityDescription, ...] = (
@@ -62,7 +132,7 @@ SENSOR_DESCRIPTIONS: tuple[OcadoSensorEntityDescription, ...] = (
                     "id": o.id,
                     "status": o.status_message,
                     "items": o.items_count,
-                    "total": f"{o.currency} {o.total_price}",
+                    "total": o.display_total,
                     "delivery_start": o.delivery_slot_start,
                     "delivery_end": o.delivery_slot_end,
                     "address": o.delivery_address,
@@ -78,19 +148,11 @@ SENSOR_DESCRIPTIONS: tuple[OcadoSensorEntityDescription, ...] = (
         icon="mdi:calendar-truck",
         device_class=SensorDeviceClass.TIMESTAMP,
         value_fn=lambda d: (
-            _parse_iso_date(d.upcoming_orders[0].delivery_slot_start)
-            if d.upcoming_orders
+            _parse_iso_date(o.delivery_slot_start)
+            if (o := d.next_order)
             else None
         ),
-        attributes_fn=lambda d: (
-            {
-                "order_id": d.upcoming_orders[0].id,
-                "delivery_method": d.upcoming_orders[0].delivery_method,
-                "address": d.upcoming_orders[0].delivery_address,
-            }
-            if d.upcoming_orders
-            else {}
-        ),
+        attributes_fn=_next_delivery_date_attrs,
     ),
     OcadoSensorEntityDescription(
         key="next_delivery_slot_end",
@@ -98,19 +160,9 @@ SENSOR_DESCRIPTIONS: tuple[OcadoSensorEntityDescription, ...] = (
         icon="mdi:clock-end",
         device_class=SensorDeviceClass.TIMESTAMP,
         value_fn=lambda d: (
-            _parse_iso_date(d.upcoming_orders[0].delivery_slot_end)
-            if d.upcoming_orders
-            else None
-        ),
-        attributes_fn=lambda d: (
-            {
-                "slot_start": d.upcoming_orders[0].delivery_slot_start,
-                "slot_end": d.upcoming_orders[0].delivery_slot_end,
-                "delivery_method": d.upcoming_orders[0].delivery_method,
-            }
-            if d.upcoming_orders
-            else {}
+            _parse_iso_date(o.delivery_slot_end) if (o := d.next_order) else None
         ),
+        attributes_fn=_next_delivery_slot_end_attrs,
     ),
     OcadoSensorEntityDescription(
         key="next_delivery_items",
@@ -118,9 +170,7 @@ SENSOR_DESCRIPTIONS: tuple[OcadoSensorEntityDescription, ...] = (
         icon="mdi:package-variant",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement="items",
-        value_fn=lambda d: (
-            d.upcoming_orders[0].items_count if d.upcoming_orders else None
-        ),
+        value_fn=lambda d: o.items_count if (o := d.next_order) else None,
     ),
     OcadoSensorEntityDescription(
         key="next_delivery_total",
@@ -130,34 +180,18 @@ SENSOR_DESCRIPTIONS: tuple[OcadoSensorEntityDescription, ...] = (
         native_unit_of_measurement="GBP",
         suggested_display_precision=2,
         value_fn=lambda d: (
-            float(d.upcoming_orders[0].total_price) if d.upcoming_orders else None
-        ),
-        attributes_fn=lambda d: (
-            {
-                "slot_cost": float(d.upcoming_orders[0].slot_cost)
-                if d.upcoming_orders[0].slot_cost
-                else None,
-                "currency": d.upcoming_orders[0].currency,
-            }
-            if d.upcoming_orders
-            else {}
+            float(o.total_price)
+            if (o := d.next_order) and o.total_price
+            else None
         ),
+        attributes_fn=_next_delivery_total_attrs,
     ),
     OcadoSensorEntityDescription(
         key="next_delivery_status",
         translation_key="next_delivery_status",
         icon="mdi:truck-check",
-        value_fn=lambda d: (
-            d.upcoming_orders[0].status_message if d.upcoming_orders else None
-        ),
-        attributes_fn=lambda d: (
-            {
-                "status_code": d.upcoming_orders[0].status,
-                "is_editable": d.upcoming_orders[0].is_editable,
-            }
-            if d.upcoming_orders
-            else {}
-        ),
+        value_fn=lambda d: o.status_message if (o := d.next_order) else None,
+        attributes_fn=_next_delivery_status_attrs,
     ),
     OcadoSensorEntityDescription(
         key="active_order_count",
@@ -194,16 +228,7 @@ SENSOR_DESCRIPTIONS: tuple[OcadoSensorEntityDescription, ...] = (
         value_fn=lambda d: (
             _parse_iso_date(d.next_slot.start_time) if d.next_slot else None
         ),
-        attributes_fn=lambda d: (
-            {
-                "end_time": _parse_iso_date(d.next_slot.end_time),
-                "slot_type": d.next_slot.slot_type,
-                "delivery_method": d.next_slot.delivery_method,
-                "address": d.next_slot.address,
-            }
-            if d.next_slot
-            else {}
-        ),
+        attributes_fn=_next_available_slot_attrs,
     ),
     # ── Last delivery ─────────────────────────────────────────────────────
     OcadoSensorEntityDescription(
@@ -212,22 +237,11 @@ SENSOR_DESCRIPTIONS: tuple[OcadoSensorEntityDescription, ...] = (
         icon="mdi:truck-check-outline",
         device_class=SensorDeviceClass.TIMESTAMP,
         value_fn=lambda d: (
-            _parse_iso_date(d.delivered_orders[0].delivery_slot_start)
-            if d.delivered_orders
+            _parse_iso_date(o.delivery_slot_start)
+            if (o := d.last_delivered_order)
             else None
         ),
-        attributes_fn=lambda d: (
-            {
-                "order_id": d.delivered_orders[0].id,
-                "items": d.delivered_orders[0].items_count,
-                "total": float(d.delivered_orders[0].total_price)
-                if d.delivered_orders[0].total_price
-                else 0.0,
-                "currency": d.delivered_orders[0].currency,
-            }
-            if d.delivered_orders
-            else {}
-        ),
+        attributes_fn=_last_delivery_date_attrs,
     ),
     # ── Subscription ──────────────────────────────────────────────────────
     OcadoSensorEntityDescription(
@@ -264,10 +278,23 @@ async def async_setup_entry(
 ) -> None:
     """Set up Ocado sensors from a config entry."""
     coordinator = entry.runtime_data
+    entry_id = entry.entry_id
+    # All sensors belong to the same service device; share one mapping
+    device_info: DeviceInfo = {
+        "identifiers": {(DOMAIN, entry_id)},
+        "name": entry.title,
+        "manufacturer": MANUFACTURER,
+        "model": "Ocado Account",
+        "entry_type": DeviceEntryType.SERVICE,
+    }
+
+    uid_prefix = entry_id + "_"
 
     async_add_entities(
-        OcadoSensor(coordinator, description, entry)
-        for description in SENSOR_DESCRIPTIONS
+        [
+            OcadoSensor(coordinator, description, uid_prefix, device_info)
+            for description in SENSOR_DESCRIPTIONS
+        ]
     )
 
 
@@ -281,39 +308,45 @@ class OcadoSensor(CoordinatorEntity[OcadoCoordinator], SensorEntity):
         self,
         coordinator: OcadoCoordinator,
         description: OcadoSensorEntityDescription,
-        entry: OcadoConfigEntry,
+        uid_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialise the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.title,
-            "manufacturer": MANUFACTURER,
-            "model": "Ocado Account",
-            "entry_type": DeviceEntryType.SERVICE,
-        }
+        self._attr_unique_id = uid_prefix + description.key
+        self._attr_device_info = device_info
+        self._value_fn = description.value_fn
+        self._attributes_fn = description.attributes_fn
+        # Computed values are reused until the coordinator publishes new data
+        self._value_data: OcadoData | None = None
+        self._value: Any = None
+        self._attrs_data: OcadoData | None = None
+        self._attrs: dict[str, Any] | None = None
 
     @property
     def native_value(self) -> Any:
         """Return the sensor value."""
-        if self.coordinator.data is None:
-            return None
-        try:
-            return self.entity_description.value_fn(self.coordinator.data)
-        except (IndexError, AttributeError, TypeError):
+        data = self.coordinator.data
+        if data is None:
             return None
+        if data is self._value_data:
+            return self._value
+        value = self._value_fn(data)
+        self._value_data = data
+        self._value = value
+        return value
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional attributes."""
-        if (
-            self.coordinator.data is None
-            or self.entity_description.attributes_fn is None
-        ):
-            return None
-        try:
-            return self.entity_description.attributes_fn(self.coordinator.data)
-        except (IndexError, AttributeError, TypeError):
+        data = self.coordinator.data
+        attributes_fn = self._attributes_fn
+        if data is None or attributes_fn is None:
             return None
+        if data is self._attrs_data:
+            return self._attrs
+        attrs = attributes_fn(data)
+        self._attrs_data = data
+        self._attrs = attrs
+        return attrs